@@ -1,102 +1,135 @@
 #!/usr/bin/env python
+import functools
 import logging
-import signal
-import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 import argparse
 from fs import FS
 from audio_processor import SirenLooper
 
 
+@functools.lru_cache(maxsize=1)
+def _build_parser(example_input: str) -> argparse.ArgumentParser:
+    """
+    Build the command line parser. Cached so repeated instantiations
+    reuse the same parser instead of rebuilding it.
+
+    Args:
+        example_input: Example input path shown in the help epilog
+
+    Returns:
+        Configured argument parser
+    """
+    parser = argparse.ArgumentParser(
+        description="Create a seamlessly looped audio file.",
+        epilog=f"Example usage: python app.py --audio {example_input} --target 30"
+    )
+    parser.add_argument(
+        "--audio",
+        type=str,
+        default=None,
+        help=f"Path to the input audio file (default: None)"
+    )
+    parser.add_argument(
+        "--target",
+        type=float,
+        default=None,
+        help="Target duration in seconds for the looped audio (default: None)"
+    )
+    parser.add_argument(
+        "--min-loop-duration",
+        type=float,
+        default=None,
+        help="Minimum loop duration in seconds. If not set, defaults to 0.1s."
+    )
+    parser.add_argument(
+        "--peak-threshold",
+        type=float,
+        default=0.1,  # Default peak height threshold for loop extraction
+        help="Peak height threshold for loop extraction (default: 0.1)"
+    )
+    return parser
+
 
 class AudioLoopManager:
     """
     Main application class that orchestrates the audio looping process.
     """
+    # Relaxation factors for retry attempts: halve the minimum loop
+    # duration and scale the peak threshold by 0.8 per step.
+    RETRY_FACTORS = tuple((0.5 ** k, 0.8 ** k) for k in range(1, 4))
     def __init__(self) -> None:
-        # Register signal handler for clean exit before anything else
-        signal.signal(signal.SIGINT, self._handle_exit)
-        
         self.fs = FS()  # Ensure FS is initialized first
         self.args = self._parse_arguments()
         
-        logging.info(f"Project root determined as: {self.fs.root}")
+        logging.info("Project root determined as: %s", self.fs.root)
         
         self.audio_file: Optional[str] = self.args.audio
         self.target_duration_sec: Optional[float] = self.args.target
         self.min_loop_duration: float = self.args.min_loop_duration
         self.peak_threshold: float = self.args.peak_threshold
 
-    def _handle_exit(self, signum, frame) -> None:
-        """
-        Handle clean exit on keyboard interrupt.
-        """
-        print("\nExiting cleanly. Goodbye!")
-        sys.exit(0)
-
     def _parse_arguments(self) -> argparse.Namespace:
         """
         Parse command line arguments.
-        
+
         Returns:
             Parsed arguments
         """
-        parser = argparse.ArgumentParser(
-            description="Create a seamlessly looped audio file.",
-            epilog=f"Example usage: python app.py --audio {self.fs.sound_input_folder / 'phaser2.wav'} --target 30"
-        )
-        parser.add_argument(
-            "--audio",
-            type=str,
-            default=None,
-            help=f"Path to the input audio file (default: None)"
-        )
-        parser.add_argument(
-            "--target",
-            type=float,
-            default=None,
-            help="Target duration in seconds for the looped audio (default: None)"
-        )
-        parser.add_argument(
-            "--min-loop-duration",
-            type=float,
-            default=None,
-            help="Minimum loop duration in seconds. If not set, defaults to 0.1s."
-        )
-        parser.add_argument(
-            "--peak-threshold",
-            type=float,
-            default=0.1,  # Default peak height threshold for loop extraction
-            help="Peak height threshold for loop extraction (default: 0.1)"
-        )
+        parser = _build_parser(str(self.fs.sound_input_folder / "phaser2.wav"))
         return parser.parse_args()
 
     def _retry_loop_detection(self, looper: SirenLooper) -> bool:
         """
         Retry loop detection with progressively relaxed parameters.
-        
+
+        All relaxed parameter sets are tried concurrently; the least
+        relaxed one that yields candidates wins.
+
         Args:
             looper: SirenLooper instance
-            
+
         Returns:
             True if loop points were found, False otherwise
         """
-        retries = 3
-        for attempt in range(1, retries + 1):
-            looper.min_loop_duration_sec /= 2
-            looper.peak_height_threshold *= 0.8
-            
-            logging.info(
-                f"Retry {attempt}/{retries} with adjusted parameters: "
-                f"min_loop_duration={looper.min_loop_duration_sec:.2f}s, "
-                f"threshold={looper.peak_height_threshold:.2f}"
-            )
-            
-            try:
-                looper.find_seamless_loop_points()
-                if looper.loop_candidates:
+        schedule = []
+        base_duration = looper.min_loop_duration_sec
+        base_threshold = looper.peak_height_threshold
+        for duration_factor, threshold_factor in self.RETRY_FACTORS:
+            duration = base_duration * duration_factor
+            threshold = base_threshold * threshold_factor
+            # Stop once parameters are too relaxed to widen the search:
+            # loops shorter than 10ms or near-zero peak thresholds only
+            # produce noise, so further O(N^2) detection passes are wasted.
+            if duration < 0.005 or threshold < 0.04:
+                logging.info("Retry parameters below useful range, truncating sweep")
+                break
+            schedule.append((duration, threshold))
+
+        if not schedule:
+            return False
+
+        logging.info("Retrying loop detection with %d relaxed parameter sets", len(schedule))
+        with ThreadPoolExecutor(max_workers=len(schedule)) as executor:
+            futures = [
+                executor.submit(looper._detect_loop_candidates, duration, height)
+                for duration, height in schedule
+            ]
+            # Walk results in schedule order so the least relaxed success wins.
+            for attempt, ((duration, height), future) in enumerate(zip(schedule, futures), start=1):
+                try:
+                    candidates = future.result()
+                except Exception as e:
+                    logging.error("Error during retry %d: %s", attempt, e)
+                    continue
+                if candidates:
+                    looper.min_loop_duration_sec = duration
+                    looper.peak_height_threshold = height
+                    looper.loop_candidates = candidates
+                    logging.info(
+                        f"Retry {attempt}/{len(schedule)} succeeded with "
+                        f"min_loop_duration={duration:.2f}s, threshold={height:.2f}"
+                    )
                     return True
-            except Exception as e:
-                logging.error(f"Error during retry {attempt}: {e}")
-                
+
         return False
@@ -1,13 +1,23 @@
 #!/usr/bin/env python
+import os
 import logging
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Set, Tuple
+
+# Resolved once per process: Path.resolve() walks every component with
+# readlink/stat syscalls, and the root never changes at runtime.
+# Assumes this file is inside the "src" directory; project root is its parent.
+_PROJECT_ROOT: Path = Path(__file__).resolve().parent.parent
 
 
 class FS:
     """
     Manages file system operations and directory structure for the application.
     """
+    # Directories already ensured in this process; FS is constructed by
+    # both logging setup and the app, and the tree never needs creating twice.
+    _dirs_created: Set[Path] = set()
+
     def __init__(self) -> None:
         self.root: Path = self.get_project_root()
         self.data_folder: Path = self.root / "data"
@@ -15,30 +25,32 @@ class FS:
         self.sound_folder: Path = self.data_folder / "sound"
         self.sound_input_folder: Path = self.sound_folder / "input"
         self.sound_output_folder: Path = self.sound_folder / "output"
+        # Listing cache keyed on (folder, extension) -> (folder mtime_ns, entries)
+        self._listing_cache: Dict[Tuple[str, str], Tuple[int, List[Path]]] = {}
         self.create_directories()
 
     def get_project_root(self) -> Path:
         """
         Determines the project root directory.
-        
+
         Returns:
             Path object pointing to the project root
         """
-        # Assumes this file is inside the "src" directory; project root is its parent.
-        return Path(__file__).resolve().parent.parent
+        return _PROJECT_ROOT
 
     def create_directories(self) -> None:
         """
         Creates all necessary directories for the application if they don't exist.
         """
+        # Only the leaves need listing: mkdir(parents=True) creates the
+        # data/ and data/sound/ levels on the way, so creating them
+        # separately just repeated full kernel path walks.
         required_folders = [
-            self.data_folder,
             self.logs_folder,
-            self.sound_folder,
             self.sound_input_folder,
             self.sound_output_folder,
         ]
-        
+
         for folder in required_folders:
             self._create_directory(folder)
     
@@ -49,17 +61,64 @@ class FS:
         Args:
             directory: Path object representing the directory to create
         """
-        directory.mkdir(parents=True, exist_ok=True)
-        logging.info(f"Ensured directory exists: {directory}")
+        if directory in FS._dirs_created:
+            return
+        # On the common startup path the tree already exists; one isdir
+        # stat is cheaper than an mkdir that fails with EEXIST.
+        if not os.path.isdir(directory):
+            directory.mkdir(parents=True, exist_ok=True)
+        FS._dirs_created.add(directory)
+        logging.debug("Ensured directory exists: %s", directory)
         
     def get_sound_input_files(self, extension: str = "wav") -> List[Path]:
         """
         Lists all files with the given extension in the input folder.
-        
+
         Args:
             extension: File extension to filter by (without the dot)
-            
+
+        Returns:
+            List of Path objects for files with the given extension
+        """
+        return self._list_folder(self.sound_input_folder, extension)
+
+    def get_sound_output_files(self, extension: str = "wav") -> List[Path]:
+        """
+        Lists all files with the given extension in the output folder.
+
+        Args:
+            extension: File extension to filter by (without the dot)
+
+        Returns:
+            List of Path objects for files with the given extension
+        """
+        return self._list_folder(self.sound_output_folder, extension)
+
+    def _list_folder(self, folder: Path, extension: str) -> List[Path]:
+        """
+        Lists files in a folder, reusing the cached listing while the
+        folder's mtime is unchanged.
+
+        Args:
+            folder: Directory to list
+            extension: File extension to filter by (without the dot)
+
         Returns:
             List of Path objects for files with the given extension
         """
-        return list(self.sound_input_folder.glob(f"*.{extension}"))
\ No newline at end of file
+        key = (str(folder), extension)
+        mtime_ns = os.stat(folder).st_mtime_ns
+        cached = self._listing_cache.get(key)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        suffix = f".{extension.lower()}"
+        # scandir avoids pathlib's per-entry Path construction during the
+        # filter and checks is_file against the DirEntry's cached stat.
+        with os.scandir(folder) as it:
+            files = [
+                Path(entry.path)
+                for entry in it
+                if entry.name.lower().endswith(suffix) and entry.is_file(follow_symlinks=False)
+            ]
+        self._listing_cache[key] = (mtime_ns, files)
+        return files
\ No newline at end of file
@@ -1,5 +1,7 @@
 #!/usr/bin/env python
 import logging
+import logging.handlers
+import queue
 from typing import Optional
 from pathlib import Path
 from compressing_rotating_file_handler import CompressingRotatingFileHandler
@@ -14,7 +16,8 @@ class LoggingManager:
     def __init__(self, log_file: Path) -> None:
         self.log_file = log_file
         self.handler: Optional[CompressingRotatingFileHandler] = None
-        
+        self.listener: Optional[logging.handlers.QueueListener] = None
+
     def setup(self, level: int = logging.INFO, max_bytes: int = 10 * 1024 * 1024, backup_count: int = 10) -> None:
         """
         Set up logging with a rotating, compressing file handler.
@@ -41,13 +44,24 @@ class LoggingManager:
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
             
-        root_logger.addHandler(self.handler)
+        # Loggers only enqueue records; the listener thread runs the
+        # formatter and file handler, so logging calls on the TUI thread
+        # never block on formatting, rotation or disk writes.
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self.listener = logging.handlers.QueueListener(
+            log_queue, self.handler, respect_handler_level=True
+        )
+        self.listener.start()
         logging.info("Logging system initialized")
-    
+
     def shutdown(self) -> None:
         """
         Properly shut down logging system
         """
+        if self.listener:
+            # Drains queued records through the handler before it closes.
+            self.listener.stop()
+            self.listener = None
         if self.handler:
-            self.handler.close()
-            logging.info("Logging system shutdown")
\ No newline at end of file
+            self.handler.close()
\ No newline at end of file
@@ -13,6 +13,13 @@ from logging_manager import LoggingManager
 from audio_loop_manager import AudioLoopManager
 from tui import TUI
 
+COLOR_MAP = {
+    'positive': '\033[92m*',  # Green
+    'negative': '\033[91m*',  # Red
+    'info': '\033[94m*'       # Blue
+}
+
+
 def print_message(message: str, message_type: str) -> None:
     """
     Prints a message with a specific type indicator.
@@ -20,13 +27,8 @@ def print_message(message: str, message_type: str) -> None:
     :param message: The message to print.
     :param message_type: The type of message ('positive', 'negative', 'info').
     """
-    color_map = {
-        'positive': '\033[92m*',  # Green
-        'negative': '\033[91m*',  # Red
-        'info': '\033[94m*'       # Blue
-    }
-    prefix = f"\033[95m[ {color_map.get(message_type, '\033[94m*')}"
-    print(f"{prefix} {message}\033[0m")
+    marker = COLOR_MAP.get(message_type, COLOR_MAP['info'])
+    print(f"\033[95m[ {marker} {message}\033[0m")
 
 
 def main() -> None:
@@ -48,11 +50,14 @@ def main() -> None:
         app = AudioLoopManager()
         ui = TUI(app)
         ui.start()
+    except KeyboardInterrupt:
+        print("\nExiting cleanly. Goodbye!")
+        sys.exit(0)
     except Exception as e:
         # Log any unhandled exceptions
         import logging
         import traceback
-        logging.error(f"Unhandled exception: {e}")
+        logging.error("Unhandled exception: %s", e)
         logging.error(traceback.format_exc())
         print_message(f"Error: {e}", "negative")
         sys.exit(1)
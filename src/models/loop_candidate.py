@@ -1,7 +1,10 @@
 #!/usr/bin/env python
 from dataclasses import dataclass
+from typing import List
 
-@dataclass(frozen=True)
+import numpy as np
+
+@dataclass(frozen=True, slots=True)
 class LoopCandidate:
     """Represents a potential loop point in audio."""
     start: int
@@ -15,4 +18,14 @@ class LoopCandidate:
 
     def duration_seconds(self, sr: int) -> float:
         """Calculate loop duration in seconds."""
-        return self.duration_samples / sr
\ No newline at end of file
+        return self.duration_samples / sr
+
+    @staticmethod
+    def bounds_seconds(candidates: List["LoopCandidate"], sr: int) -> np.ndarray:
+        """Start/end times for a batch of candidates as one (N, 2) array,
+        converted to seconds in a single vector op instead of per-object
+        divisions."""
+        if not candidates:
+            return np.empty((0, 2))
+        bounds = np.array([(c.start, c.end) for c in candidates], dtype=np.int64)
+        return bounds / sr
\ No newline at end of file
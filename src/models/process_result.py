@@ -2,7 +2,7 @@
 from dataclasses import dataclass
 import numpy as np
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ProcessResult:
     """Immutable container for audio processing results."""
     looped_audio: np.ndarray
@@ -1,4 +1,25 @@
 #!/usr/bin/env python
+import curses
+import os
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from tui.modals import SelectionModal, PromptModal, ConfirmModal
+from tui.views import ListPane, LogPane, LegendPane
+
+
+# Focus rotation for Tab; cycling advances an index instead of
+# rebuilding a transition dict and hashing strings per keypress.
+_FOCUS_ORDER = ('input', 'output', 'log')
+
+
+def _ts():
+    """Cheap HH:MM:SS timestamp for log messages (no datetime object)."""
+    lt = time.localtime()
+    return f"{lt.tm_hour:02d}:{lt.tm_min:02d}:{lt.tm_sec:02d}"
+
 
 class TUI:
     """Text-based UI controller for the AudioLooperApp."""
@@ -7,24 +28,41 @@ class TUI:
         self.fs = app.fs
         self.min_loop_duration = app.min_loop_duration
         self.peak_threshold = app.peak_threshold
+        # Event-loop state; populated in _main.
+        self.stdscr = None
+        self.legend_pane = None
+        self.input_pane = None
+        self.output_pane = None
+        self.log_pane = None
+        self._focus_idx = 0
+        self.focus = _FOCUS_ORDER[self._focus_idx]
+        self.player_proc = None
+        self.files_in = []
+        self.files_out = []
+        self.files_out_dirty = False
+        self._pending_files_in = []
+        self._scan_thread = None
 
     def start(self):
-        import curses
         curses.wrapper(self._main)
 
-    def _main(self, stdscr):
-        stdscr.clear()
-        stdscr.refresh()
-        import curses
-        import subprocess
-        import tempfile
-        from datetime import datetime
-        import soundfile as sf
-        from audio_processor import SirenLooper
-        from tui.views import ListPane, LogPane, LegendPane
-        from tui.modals import SelectionModal, PromptModal, ConfirmModal
+    def _run_blocking(self, description, action_func, log_pane):
+        """Run a blocking operation on a worker thread, animating the log
+        pane while it runs so the UI does not appear frozen."""
+        ts = _ts()
+        log_pane.add_message(f"{ts} {description}")
+        spinner = "|/-\\"
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(action_func)
+            tick = 0
+            while not wait([future], timeout=0.1).done:
+                log_pane.update_last(f"{ts} {description} {spinner[tick % len(spinner)]}")
+                tick += 1
+            log_pane.update_last(f"{ts} {description}")
+            return future.result()
 
-        # Initialize curses settings
+    def _init_curses(self, stdscr):
+        """Apply global curses settings for the session."""
         curses.curs_set(0)
         stdscr.nodelay(False)
         stdscr.keypad(True)
@@ -34,7 +72,8 @@ class TUI:
         curses.init_pair(2, curses.COLOR_GREEN, -1)
         curses.init_pair(3, curses.COLOR_BLUE, -1)
 
-        # Determine layout dimensions
+    def _create_panes(self, stdscr):
+        """Lay out the windows and build the view components."""
         max_y, max_x = stdscr.getmaxyx()
         legend_h = 1
         gap = 2
@@ -42,132 +81,220 @@ class TUI:
         pane_h = max_y - legend_h - log_h
         pane_w = (max_x - gap) // 2
 
-        # Create windows
         legend_win = curses.newwin(legend_h, max_x, 0, 0)
         input_win = curses.newwin(pane_h, pane_w, legend_h, 0); input_win.keypad(True)
         output_win = curses.newwin(pane_h, pane_w, legend_h, pane_w + gap); output_win.keypad(True)
         log_win = curses.newwin(log_h, max_x, legend_h + pane_h, 0); log_win.keypad(True)
 
-        # Instantiate view components
-        legend_pane = LegendPane(legend_win)
-        input_pane = ListPane(input_win, 'Input')
-        output_pane = ListPane(output_win, 'Output')
-        log_pane = LogPane(log_win)
+        self.legend_pane = LegendPane(legend_win)
+        self.input_pane = ListPane(input_win, 'Input')
+        self.output_pane = ListPane(output_win, 'Output')
+        self.log_pane = LogPane(log_win)
+
+    def _repaint_all(self):
+        """Force full repaints, e.g. after a modal overdrew pane regions."""
+        self.legend_pane.touch()
+        self.input_pane.touch()
+        self.output_pane.touch()
+        self.log_pane.touch()
+
+    def _scan_input(self):
+        self._pending_files_in.append(self.fs.get_sound_input_files())
+
+    def _refresh_listings(self):
+        """Swap in prefetched input listings and lazily refresh output.
+
+        Input refreshes run on a prefetch thread so a slow filesystem
+        (NFS/sshfs input folders) never stalls the UI loop; the output
+        listing only changes through our own save/delete actions.
+        """
+        if self._pending_files_in:
+            self.files_in = self._pending_files_in.pop()
+            self._pending_files_in.clear()
+        if self._scan_thread is None or not self._scan_thread.is_alive():
+            self._scan_thread = threading.Thread(target=self._scan_input, daemon=True)
+            self._scan_thread.start()
+        if self.files_out_dirty:
+            self.files_out = self.fs.get_sound_output_files()
+            self.files_out_dirty = False
+
+    def _render_frame(self):
+        """Update pane states and flush one frame to the terminal."""
+        self.input_pane.set_items(self.files_in)
+        self.input_pane.set_focus(self.focus == 'input')
+        self.output_pane.set_items(self.files_out)
+        self.output_pane.set_focus(self.focus == 'output')
+        self.log_pane.set_focus(self.focus == 'log')
+
+        # Each pane stages with noutrefresh; one doupdate flushes the
+        # frame in a single terminal write.
+        self.legend_pane.render(self.focus)
+        self.input_pane.render()
+        self.output_pane.render()
+        self.log_pane.render()
+        curses.doupdate()
+
+    def _stop_playback(self):
+        if self.player_proc:
+            self.player_proc.terminate()
+            self.player_proc = None
+        self.stdscr.timeout(-1)
+
+    def _poll_playback(self):
+        """Reap a finished player process and drop back to blocking
+        getch; only runs on the timeout wakeups active during playback."""
+        if self.player_proc and self.player_proc.poll() is not None:
+            self.player_proc = None
+            self.stdscr.timeout(-1)
+            self.log_pane.add_message(f"{_ts()} Finished playing")
+
+    def _handle_scroll(self, key):
+        if self.focus == 'log':
+            self.log_pane.handle_key(key)
+        else:
+            self._stop_playback()
+            if self.focus == 'input':
+                self.input_pane.handle_key(key)
+            elif self.focus == 'output':
+                self.output_pane.handle_key(key)
+
+    def _toggle_playback(self):
+        pane = self.input_pane if self.focus == 'input' else self.output_pane
+        selected = pane.get_selected()
+        if not selected:
+            return
+        path = str(selected)
+        ts = _ts()
+        if self.player_proc:
+            self._stop_playback()
+            self.log_pane.add_message(f"{ts} Stopped playing {path}")
+        else:
+            self.player_proc = subprocess.Popen(['aplay', '-q', path])
+            # Wake periodically while playing so we notice when aplay ends.
+            self.stdscr.timeout(200)
+            self.log_pane.add_message(f"{ts} Started playing {path}")
+
+    def _loop_selected(self, stdscr):
+        """Run the full loop workflow for the selected input file:
+        load, detect, pick a candidate, prompt for duration, save."""
+        # audio_processor stays a deferred import: it pulls in the
+        # soundfile/scipy stack (and librosa lazily behind that), which
+        # the TUI only needs once the user actually runs the loop
+        # workflow.
+        from audio_processor import SirenLooper
+
+        selected = self.input_pane.get_selected()
+        if not selected:
+            return
+        log_pane = self.log_pane
+        looper = self._run_blocking(
+            "Loading audio...",
+            lambda: SirenLooper(
+                selected.name,
+                self.fs,
+                min_loop_duration_sec=self.min_loop_duration or 0.1,
+                peak_height_threshold=self.peak_threshold
+            ),
+            log_pane
+        )
+        candidates = self._run_blocking(
+            "Finding loop points...", looper.find_seamless_loop_points, log_pane
+        )
+        if not candidates:
+            log_pane.add_message(f"{_ts()} No loop points found, retrying with relaxed parameters")
+            if self._run_blocking(
+                "Retrying loop detection...",
+                lambda: self.app._retry_loop_detection(looper),
+                log_pane
+            ):
+                candidates = looper.loop_candidates
+                log_pane.add_message(f"{_ts()} Found loop points after retries")
+            else:
+                log_pane.add_message(f"{_ts()} No loop points found after retries")
+                return
+        if len(candidates) > 1:
+            sel_idx = SelectionModal(stdscr, candidates, looper).show()
+            self._repaint_all()
+            if sel_idx is None:
+                return
+            chosen = candidates[sel_idx]
+        else:
+            chosen = candidates[0]
+        loop_d = chosen.duration_seconds(looper.sr)
+        prompt = PromptModal(
+            stdscr,
+            f"Enter target duration >= {2 * loop_d:.2f}s:"
+        ).show()
+        self._repaint_all()
+        if prompt is None:
+            log_pane.add_message(f"{_ts()} Cancelled target input")
+            return
+        # The prompt only admits digits and '.', so a plain string check
+        # beats raising/catching ValueError around float().
+        if not prompt.replace('.', '', 1).isdigit():
+            log_pane.add_message("Invalid input. Try again.")
+            return
+        target = float(prompt)
+        if target < 2 * loop_d:
+            log_pane.add_message("Target too short. Try again.")
+            return
+        output_name = f"{selected.stem}_loop{(candidates.index(chosen)+1)}_{int(target)}s.wav"
+        result = self._run_blocking(
+            "Processing and saving...",
+            lambda: looper.process_and_save(target, output_file=output_name),
+            log_pane
+        )
+        self.files_out_dirty = True
+        log_pane.add_message(f"{_ts()} Saved looped file: {result.audio_path}")
+
+    def _delete_selected(self, stdscr):
+        selected = self.output_pane.get_selected()
+        if not selected:
+            return
+        confirm = ConfirmModal(
+            stdscr,
+            f"Delete '{selected.name}'?"
+        ).show()
+        self._repaint_all()
+        if not confirm:
+            return
+        os.unlink(str(selected))
+        self.files_out_dirty = True
+        self.log_pane.add_message(f"{_ts()} Deleted {selected.name}")
+
+    def _handle_key(self, stdscr, key):
+        """Dispatch one keypress; returns False when the app should quit."""
+        if key == -1:  # getch timeout while playback is active
+            return True
+        if key == ord('q'):
+            return False
+        elif key == 9:  # Tab
+            self._focus_idx = (self._focus_idx + 1) % len(_FOCUS_ORDER)
+            self.focus = _FOCUS_ORDER[self._focus_idx]
+        elif key in (curses.KEY_UP, curses.KEY_DOWN):
+            self._handle_scroll(key)
+        elif key == ord('p'):
+            self._toggle_playback()
+        elif key == ord('l') and self.focus == 'input':
+            self._loop_selected(stdscr)
+        elif key == ord('d') and self.focus == 'output':
+            self._delete_selected(stdscr)
+        return True
+
+    def _main(self, stdscr):
+        stdscr.clear()
+        stdscr.refresh()
+        self.stdscr = stdscr
+        self._init_curses(stdscr)
+        self._create_panes(stdscr)
 
-        player_proc = None
-        focus = 'input'
+        self.files_in = self.fs.get_sound_input_files()
+        self.files_out = self.fs.get_sound_output_files()
 
-        # Main event loop
         while True:
-            files_in = self.fs.get_sound_input_files()
-            files_out = list(self.fs.sound_output_folder.glob('*.wav'))
-
-            # Update pane states
-            input_pane.set_items(files_in)
-            input_pane.set_focus(focus == 'input')
-            output_pane.set_items(files_out)
-            output_pane.set_focus(focus == 'output')
-            log_pane.set_focus(focus == 'log')
-
-            # Render panes
-            legend_pane.render(focus)
-            input_pane.render()
-            output_pane.render()
-            log_pane.render()
-
-            # Handle input
+            self._refresh_listings()
+            self._poll_playback()
+            self._render_frame()
             key = stdscr.getch()
-            if key == ord('q'):
+            if not self._handle_key(stdscr, key):
                 break
-            elif key == 9:  # Tab
-                focus = {'input': 'output', 'output': 'log', 'log': 'input'}[focus]
-            elif key in (curses.KEY_UP, curses.KEY_DOWN):
-                if focus == 'log':
-                    log_pane.handle_key(key)
-                else:
-                    if player_proc:
-                        player_proc.terminate()
-                        player_proc = None
-                    if focus == 'input':
-                        input_pane.handle_key(key)
-                    elif focus == 'output':
-                        output_pane.handle_key(key)
-            elif key == ord('p'):
-                pane = input_pane if focus == 'input' else output_pane
-                selected = pane.get_selected()
-                if selected:
-                    path = str(selected)
-                    ts = datetime.now().strftime("%H:%M:%S")
-                    if player_proc:
-                        player_proc.terminate()
-                        player_proc = None
-                        log_pane.add_message(f"{ts} Stopped playing {path}")
-                    else:
-                        player_proc = subprocess.Popen(['aplay', '-q', path])
-                        log_pane.add_message(f"{ts} Started playing {path}")
-            elif key == ord('l') and focus == 'input':
-                selected = input_pane.get_selected()
-                if not selected:
-                    continue
-                looper = SirenLooper(
-                    selected.name,
-                    self.fs,
-                    min_loop_duration_sec=self.min_loop_duration or 0.1,
-                    peak_height_threshold=self.peak_threshold
-                )
-                ts = datetime.now().strftime("%H:%M:%S")
-                log_pane.add_message(f"{ts} Finding loop points...")
-                candidates = looper.find_seamless_loop_points()
-                if not candidates:
-                    log_pane.add_message(f"{ts} No loop points found, retrying with relaxed parameters")
-                    if self.app._retry_loop_detection(looper):
-                        candidates = looper.loop_candidates
-                        ts = datetime.now().strftime("%H:%M:%S")
-                        log_pane.add_message(f"{ts} Found loop points after retries")
-                    else:
-                        ts = datetime.now().strftime("%H:%M:%S")
-                        log_pane.add_message(f"{ts} No loop points found after retries")
-                        continue
-                if len(candidates) > 1:
-                    sel_idx = SelectionModal(stdscr, candidates, looper).show()
-                    if sel_idx is None:
-                        continue
-                    chosen = candidates[sel_idx]
-                else:
-                    chosen = candidates[0]
-                loop_d = chosen.duration_seconds(looper.sr)
-                prompt = PromptModal(
-                    stdscr,
-                    f"Enter target duration >= {2 * loop_d:.2f}s:"
-                ).show()
-                if prompt is None:
-                    ts = datetime.now().strftime("%H:%M:%S")
-                    log_pane.add_message(f"{ts} Cancelled target input")
-                    continue
-                try:
-                    target = float(prompt)
-                    if target < 2 * loop_d:
-                        log_pane.add_message("Target too short. Try again.")
-                        continue
-                except ValueError:
-                    log_pane.add_message("Invalid input. Try again.")
-                    continue
-                ts = datetime.now().strftime("%H:%M:%S")
-                log_pane.add_message(f"{ts} Processing and saving...")
-                output_name = f"{selected.stem}_loop{(candidates.index(chosen)+1)}_{int(target)}s.wav"
-                result = looper.process_and_save(target, output_file=output_name)
-                ts = datetime.now().strftime("%H:%M:%S")
-                log_pane.add_message(f"{ts} Saved looped file: {result.audio_path}")
-            elif key == ord('d') and focus == 'output':
-                selected = output_pane.get_selected()
-                if not selected:
-                    continue
-                confirm = ConfirmModal(
-                    stdscr,
-                    f"Delete '{selected.name}'?"
-                ).show()
-                if not confirm:
-                    continue
-                selected.unlink()
-                ts = datetime.now().strftime("%H:%M:%S")
-                log_pane.add_message(f"{ts} Deleted {selected.name}")
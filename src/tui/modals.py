@@ -1,8 +1,34 @@
 #!/usr/bin/env python
 import curses
-import tempfile
 import subprocess
-import soundfile as sf
+import threading
+
+from models import LoopCandidate
+
+
+def _feed_stdin(proc, data):
+    """Stream raw sample bytes into a player process; tolerate the pipe
+    closing early when playback is stopped."""
+    try:
+        proc.stdin.write(data)
+        proc.stdin.close()
+    except (BrokenPipeError, OSError):
+        pass
+
+
+def _play_segment(y, sr):
+    """Play a decoded audio segment by piping raw float32 PCM to aplay.
+
+    Avoids re-encoding the segment to a WAV file on disk; the feeder
+    thread keeps the UI from blocking on the pipe."""
+    proc = subprocess.Popen(
+        ['aplay', '-q', '-t', 'raw', '-f', 'FLOAT_LE', '-c', '1', '-r', str(sr), '-'],
+        stdin=subprocess.PIPE
+    )
+    data = y.astype('<f4', copy=False).tobytes()
+    threading.Thread(target=_feed_stdin, args=(proc, data), daemon=True).start()
+    return proc
+
 
 class SelectionModal:
     def __init__(self, stdscr, candidates, looper):
@@ -23,33 +49,37 @@ class SelectionModal:
         win.keypad(True)
         win.bkgd(' ', curses.color_pair(2))
         modal_player = None
+        # Frame and candidate rows are static: draw them once, then only
+        # move the selection marker per keypress.
+        win.erase(); win.box(); win.addstr(0, 2, "Select Loop Point")
+        bounds = LoopCandidate.bounds_seconds(self.candidates, self.looper.sr)
+        for idx, (s, e) in enumerate(bounds):
+            label = f"{idx+1}. {s:.2f}-{e:.2f}" + (" (best)" if idx == 0 else "")
+            win.addstr(1 + idx, 4, label)
+        win.addstr(modal_h - 2, 2, "Enter=select  p-play")
+        win.addch(1 + self.selected, 2, '>')
+        win.refresh()
         while True:
-            win.clear(); win.box(); win.addstr(0, 2, "Select Loop Point")
-            for idx, c in enumerate(self.candidates):
-                s = c.start / self.looper.sr; e = c.end / self.looper.sr
-                label = f"{idx+1}. {s:.2f}-{e:.2f}" + (" (best)" if idx == 0 else "")
-                marker = '>' if idx == self.selected else ' '
-                win.addstr(1 + idx, 2, f"{marker} {label}")
-            win.addstr(modal_h - 2, 2, "Enter=select  p-play"); win.refresh()
             k = win.getch()
             if k == ord('q'):
                 self.aborted = True; break
             elif k in (curses.KEY_UP, curses.KEY_DOWN):
+                win.addch(1 + self.selected, 2, ' ')
                 if k == curses.KEY_UP:
                     self.selected = (self.selected - 1) % num
                 else:
                     self.selected = (self.selected + 1) % num
+                win.addch(1 + self.selected, 2, '>')
+                win.refresh()
             elif k == ord('p'):
                 if modal_player:
                     modal_player.terminate(); modal_player = None
                 else:
-                    tmp = tempfile.NamedTemporaryFile(suffix='.wav', delete=False)
                     seg = self.looper.y[self.candidates[self.selected].start:self.candidates[self.selected].end]
-                    sf.write(tmp.name, seg, self.looper.sr)
-                    modal_player = subprocess.Popen(['aplay', '-q', tmp.name])
+                    modal_player = _play_segment(seg, self.looper.sr)
             elif k in (10, 13):
                 break
-        win.clear(); win.refresh(); del win
+        win.erase(); win.refresh(); del win
         return None if self.aborted else self.selected
 
 class PromptModal:
@@ -83,7 +113,7 @@ class PromptModal:
                 if ch.isdigit() or ch == '.':
                     inp += ch; win.addstr(2, 4 + len(inp) - 1, ch)
         curses.curs_set(0)
-        win.clear(); win.refresh(); del win
+        win.erase(); win.refresh(); del win
         return None if self.aborted else inp.strip()
 
 class ConfirmModal:
@@ -99,9 +129,11 @@ class ConfirmModal:
         starty = (max_y - mh) // 2
         startx = (max_x - mw) // 2
         win = curses.newwin(mh, mw, starty, startx)
-        win.keypad(True); win.box(); win.bkgd(' ', curses.color_pair(2))
+        win.keypad(True); win.bkgd(' ', curses.color_pair(2))
+        # Frame and prompt are static; per keypress only the Yes/No
+        # highlight attributes change.
+        win.erase(); win.box(); win.addstr(1, 2, self.prompt)
         while True:
-            win.clear(); win.box(); win.addstr(1, 2, self.prompt)
             yes_attr = curses.A_REVERSE if self.confirm else curses.A_NORMAL
             no_attr = curses.A_REVERSE if not self.confirm else curses.A_NORMAL
             win.addstr(3, mw // 2 - 5, " Yes ", yes_attr)
@@ -114,5 +146,5 @@ class ConfirmModal:
                 self.confirm = not self.confirm
             elif k in (10, 13):
                 break
-        win.clear(); win.refresh(); del win
+        win.erase(); win.refresh(); del win
         return False if self.aborted else self.confirm
\ No newline at end of file
@@ -1,32 +1,52 @@
 #!/usr/bin/env python
 import curses
+from collections import deque
+from itertools import islice
 
 class BasePane:
     def __init__(self, win, title):
         self.win = win
         self.title = title
+        self._title_key = title.lower()
         self.focus = False
         self.in_modal = False
         self.modal_origin = None
+        self.dirty = True
 
     def set_focus(self, focused):
-        self.focus = focused
+        if focused != self.focus:
+            self.focus = focused
+            self.dirty = True
 
     def set_modal(self, in_modal, modal_origin):
-        self.in_modal = in_modal
-        self.modal_origin = modal_origin
+        if in_modal != self.in_modal or modal_origin != self.modal_origin:
+            self.in_modal = in_modal
+            self.modal_origin = modal_origin
+            self.dirty = True
+
+    def touch(self):
+        """Force a full repaint on the next render (e.g. after a modal
+        overdrew this pane's region)."""
+        self.dirty = True
+
+    # Color pair number by (modal originates here, focused) state.
+    PAIR_BY_STATE = {
+        (True, True): 3,
+        (True, False): 3,
+        (False, True): 2,
+        (False, False): 1,
+    }
 
     def render_title(self):
-        if self.in_modal and self.modal_origin == self.title.lower():
-            cp = curses.color_pair(3)
-        elif self.focus:
-            cp = curses.color_pair(2)
-        else:
-            cp = curses.color_pair(1)
+        modal_here = self.in_modal and self.modal_origin == self._title_key
+        cp = curses.color_pair(self.PAIR_BY_STATE[(modal_here, self.focus)])
         self.win.bkgd(' ', cp)
-        self.win.clear()
+        # erase() marks cells dirty for ncurses' damage tracking;
+        # clear() would force a full physical repaint and flicker.
+        self.win.erase()
         self.win.box()
         self.win.addstr(0, 2, self.title, cp)
+        return cp
 
 
 class ListPane(BasePane):
@@ -35,37 +55,75 @@ class ListPane(BasePane):
         self.items = []
         self.selected = 0
         self.scroll = 0
+        self.pad = None
+        self._marker_row = None
+        self.names = []
 
     def set_items(self, items):
-        self.items = items
+        if items != self.items:
+            self.items = items
+            # Compute display names once per listing change; pathlib
+            # re-derives .name on every access.
+            self.names = [getattr(item, 'name', str(item)) for item in items]
+            self.pad = None
+            self.dirty = True
         if self.selected >= len(items):
             self.selected = max(0, len(items) - 1)
+            self.dirty = True
         self._adjust_scroll()
 
+    def _build_pad(self):
+        """Write the item rows into a pad once; renders then only move
+        the viewport instead of re-adding every row."""
+        h, w = self.win.getmaxyx()
+        rows = max(len(self.items), 1)
+        self.pad = curses.newpad(rows, max(w, 8))
+        name_width = max(w - 6, 1)
+        for idx, name in enumerate(self.names):
+            self.pad.addnstr(idx, 2, name, name_width)
+        self._marker_row = None
+
+    def _draw_marker(self):
+        """Move the cursor marker with two cell writes instead of
+        rewriting every row."""
+        if self._marker_row is not None and self._marker_row < max(len(self.items), 1):
+            self.pad.addch(self._marker_row, 0, ' ')
+        if self.focus and self.items:
+            self.pad.addch(self.selected, 0, '>')
+            self._marker_row = self.selected
+        else:
+            self._marker_row = None
+
     def _adjust_scroll(self):
         h, _ = self.win.getmaxyx()
         visible = h - 2
         if self.selected < self.scroll:
             self.scroll = self.selected
+            self.dirty = True
         elif self.selected >= self.scroll + visible:
             self.scroll = self.selected - visible + 1
+            self.dirty = True
 
     def render(self):
-        self.render_title()
+        if not self.dirty:
+            return
+        cp = self.render_title()
         h, w = self.win.getmaxyx()
         visible = h - 2
-        disp = self.items[self.scroll:self.scroll + visible]
-        for idx, item in enumerate(disp):
-            actual = self.scroll + idx
-            marker = '>' if self.focus and actual == self.selected else ' '
-            name = getattr(item, 'name', str(item))
-            self.win.addstr(1 + idx, 2, f"{marker} {name}")
         if len(self.items) > visible:
             if self.scroll > 0:
                 self.win.addch(1, w - 2, '^')
             if self.scroll + visible < len(self.items):
                 self.win.addch(h - 2, w - 2, 'v')
-        self.win.refresh()
+        self.win.noutrefresh()
+        if self.pad is None:
+            self._build_pad()
+        self.pad.bkgd(' ', cp)
+        self._draw_marker()
+        if visible > 0 and w > 4:
+            top, left = self.win.getbegyx()
+            self.pad.noutrefresh(self.scroll, 0, top + 1, left + 2, top + visible, left + w - 3)
+        self.dirty = False
 
     def handle_key(self, key):
         if key not in (curses.KEY_UP, curses.KEY_DOWN):
@@ -76,6 +134,7 @@ class ListPane(BasePane):
             self.selected = (self.selected - 1) % len(self.items)
         else:
             self.selected = (self.selected + 1) % len(self.items)
+        self.dirty = True
         self._adjust_scroll()
 
     def get_selected(self):
@@ -85,59 +144,86 @@ class ListPane(BasePane):
 
 
 class LogPane(BasePane):
+    # Bound log history so a long session can't grow memory without limit.
+    MAX_MESSAGES = 2048
+
     def __init__(self, win):
         super().__init__(win, 'Log')
-        self.messages = []
+        self.messages = deque(maxlen=self.MAX_MESSAGES)
         self.scroll = 0
+        # Window height is fixed for the pane's lifetime; keep the scroll
+        # bound up to date on append instead of recomputing per keypress.
+        self.height = max(self.win.getmaxyx()[0] - 2, 1)
+        self.max_scroll = 0
 
     def add_message(self, message):
         self.messages.append(message)
+        self.max_scroll = max(0, len(self.messages) - self.height)
         self.scroll = 0
+        self.dirty = True
+
+    def update_last(self, message):
+        """Rewrite the most recent message, repainting only its line
+        instead of the whole pane."""
+        if not self.messages:
+            self.add_message(message)
+            return
+        self.messages[-1] = message
+        h, w = self.win.getmaxyx()
+        row = len(self.messages) - 1 - self.scroll
+        if 0 <= row < h - 2:
+            self.win.addstr(1 + row, 2, message[:w - 4].ljust(w - 4))
+            self.win.refresh()
 
     def handle_key(self, key):
         if key not in (curses.KEY_UP, curses.KEY_DOWN):
             return
-        h, _ = self.win.getmaxyx()
-        height = h - 2
-        max_scroll = max(0, len(self.messages) - height)
         delta = -1 if key == curses.KEY_UP else 1
-        self.scroll = max(0, min(self.scroll + delta, max_scroll))
+        scroll = max(0, min(self.scroll + delta, self.max_scroll))
+        if scroll != self.scroll:
+            self.scroll = scroll
+            self.dirty = True
 
     def render(self):
-        if self.in_modal and self.modal_origin == 'log':
-            cp = curses.color_pair(3)
-        elif self.focus:
-            cp = curses.color_pair(2)
-        else:
-            cp = curses.color_pair(1)
-        self.win.bkgd(' ', cp)
-        self.win.clear()
-        self.win.box()
-        self.win.addstr(0, 2, self.title, cp)
+        if not self.dirty:
+            return
+        self.render_title()
         h, w = self.win.getmaxyx()
         height = h - 2
         start = self.scroll
         end = min(start + height, len(self.messages))
-        for idx, line in enumerate(self.messages[start:end]):
-            self.win.addstr(1 + idx, 2, line[:w - 4])
+        limit = w - 4
+        for idx, line in enumerate(islice(self.messages, start, end)):
+            # Only pay for a truncated copy when the line overflows.
+            self.win.addstr(1 + idx, 2, line if len(line) <= limit else line[:limit])
         if len(self.messages) > height:
             if self.scroll > 0:
                 self.win.addch(1, w - 2, '^')
             if end < len(self.messages):
                 self.win.addch(h - 2, w - 2, 'v')
-        self.win.refresh()
+        self.win.noutrefresh()
+        self.dirty = False
 
 
 class LegendPane:
+    LEGENDS = {
+        'input': "p-play  q-quit  l-loop",
+        'output': "p-play  q-quit  d-delete",
+    }
+    DEFAULT_LEGEND = "p-play  q-quit"
+
     def __init__(self, win):
         self.win = win
+        self._last_focus = None
+
+    def touch(self):
+        """Force a repaint on the next render."""
+        self._last_focus = None
 
     def render(self, focus):
-        self.win.clear()
-        legend = "p-play  q-quit"
-        if focus == 'input':
-            legend += "  l-loop"
-        elif focus == 'output':
-            legend += "  d-delete"
-        self.win.addstr(0, 2, legend)
-        self.win.refresh()
\ No newline at end of file
+        if focus == self._last_focus:
+            return
+        self.win.erase()
+        self.win.addstr(0, 2, self.LEGENDS.get(focus, self.DEFAULT_LEGEND))
+        self.win.noutrefresh()
+        self._last_focus = focus
\ No newline at end of file